@@ -23,18 +23,41 @@ Author: Richard (Red Specter) + Vigil (AI Partner)
 """
 
 import argparse
+import functools
+import heapq
+import io
+import os
 import re
+import sys
 from urllib.parse import urlparse
-from dataclasses import dataclass, field
-from typing import List, Optional, Dict, Tuple, Iterable
-from collections import Counter
-
-
-SCRIPT_SRC_RE = re.compile(r'src=["\']([^"\']+)["\']', re.IGNORECASE)
-
-
-@dataclass
-class ScriptEntry:
+from concurrent.futures import ProcessPoolExecutor
+
+# Optional: pyahocorasick lets us scan each URL once for every pattern and
+# heuristic keyword instead of one substring test per pattern. The tool stays
+# stdlib-only; the automaton is used only when the package happens to be there.
+try:
+    import ahocorasick  # type: ignore
+except ImportError:
+    ahocorasick = None
+
+# Optional: pandas enables vectorized classification of large inventories.
+try:
+    import pandas  # type: ignore
+except ImportError:
+    pandas = None
+from typing import List, Optional, Dict, Tuple, Iterable, TextIO, NamedTuple
+from collections import defaultdict
+
+
+# Anchored on <script\b so the pattern itself gates tag lines; the lazy
+# [^>]*? and explicit boundaries keep backtracking bounded on long HTML lines.
+SCRIPT_SRC_RE = re.compile(
+    r'<script\b[^>]*?\ssrc\s*=\s*["\']([^"\']+)["\']',
+    re.IGNORECASE,
+)
+
+
+class ScriptEntry(NamedTuple):
     raw: str
     url: str
     scheme: str
@@ -43,7 +66,7 @@ class ScriptEntry:
     category: str
     subcategory: str
     first_party: bool
-    notes: List[str] = field(default_factory=list)
+    notes: Tuple[str, ...] = ()
 
     def domain_label(self) -> str:
         return self.host or "(no host)"
@@ -113,37 +136,160 @@ CATEGORY_RULES: Dict[str, List[str]] = {
 }
 
 
+# Flatten CATEGORY_RULES for rank-ordered matching. _PATTERN_TO_CAT keeps
+# the global pattern order (category-major, list order within a category),
+# which is the priority the original nested scan implemented. One compiled
+# alternation per category lets classify_script test whole categories with
+# a single C-level scan while still honouring that priority: a regex over
+# ALL patterns would return the leftmost match in the string, not the
+# highest-priority pattern.
+_PATTERN_TO_CAT: Dict[str, str] = {
+    pattern.lower(): cat
+    for cat, patterns in CATEGORY_RULES.items()
+    for pattern in patterns
+}
+_CATEGORY_LIST: List[str] = list(CATEGORY_RULES)
+_CAT_RANK: Dict[str, int] = {cat: rank for rank, cat in enumerate(_CATEGORY_LIST)}
+_CAT_PATTERNS: List[List[str]] = [
+    [p.lower() for p in patterns] for patterns in CATEGORY_RULES.values()
+]
+_CAT_RES: List[re.Pattern] = [
+    re.compile("|".join(re.escape(p) for p in patterns))
+    for patterns in _CAT_PATTERNS
+]
+
+# Escapes literal pipes so URLs can't break the Markdown tables; a single
+# translate() pass per field instead of one replace() scan each.
+_MD_ESCAPE = str.maketrans({"|": "\\|"})
+
+# Static summary sections, folded into constants at import so the report
+# writer only formats the dynamic counts and table rows per run.
+_CATEGORY_HEADER = "## Category Breakdown\n\n"
+_TP_DOMAIN_HEADER = "## Top Third-Party Domains\n\n"
+_SUMMARY_TAIL = (
+    "## Suggested Talking Points\n"
+    "\n"
+    "- Review all **third-party analytics and tracking scripts** for data minimisation and consent.\n"
+    "- Consider **Subresource Integrity (SRI)** for CDN-hosted libraries where feasible.\n"
+    "- Tighten your **Content-Security-Policy (CSP)** `script-src` to only allow the domains listed here.\n"
+    "- Audit embedded **payment, social, and widget scripts** for unnecessary permissions and data access.\n"
+    "- Maintain this script inventory as part of your **vendor and supply-chain security** documentation.\n"
+)
+
+# Heuristic keywords that only add notes, never a category.
+_HEURISTIC_NOTES: Dict[str, str] = {
+    "widget": "Widget-style script (embedded component)",
+    "tracker": "Tracking-related identifier in URL",
+    "track": "Tracking-related identifier in URL",
+    "bundle": "Large JS bundle – may include multiple libraries",
+    "vendor": "Large JS bundle – may include multiple libraries",
+}
+
+
+def _build_host_trie() -> Dict:
+    """Trie over reversed host labels for the suffix-style patterns.
+
+    Most category patterns are plain host suffixes (doubleclick.net,
+    js.stripe.com); matching those label-by-label from the TLD inward is
+    O(labels) per host. Patterns with slashes, bare keywords, and prefix
+    forms like "cdn." stay on the substring fallback.
+    """
+    trie: Dict = {}
+    for cat, patterns in CATEGORY_RULES.items():
+        for pattern in patterns:
+            p = pattern.lower()
+            if "/" in p or "." not in p or p.startswith(".") or p.endswith("."):
+                continue
+            node = trie
+            for label in reversed(p.split(".")):
+                node = node.setdefault(label, {})
+            node[""] = (cat, pattern)  # terminal marker; "" is never a label
+    return trie
+
+
+_HOST_TRIE = _build_host_trie()
+
+
+def _host_suffix_lookup(host: str) -> Optional[Tuple[str, str]]:
+    node = _HOST_TRIE
+    hit = None
+    for label in reversed(host.split(".")):
+        if not label:
+            # Empty label (leading/trailing/double dot): malformed host,
+            # and "" would collide with the terminal marker key.
+            break
+        node = node.get(label)
+        if node is None:
+            break
+        term = node.get("")
+        if term is not None:
+            hit = term  # keep walking: the most specific suffix wins
+    return hit
+
+
+def _first_category_pattern(rank: int, combined: str) -> str:
+    # Resolve which pattern of an already-matched category won, in list
+    # order like the original scan; categories hold at most a few patterns.
+    for pattern in _CAT_PATTERNS[rank]:
+        if pattern in combined:
+            return pattern
+    return ""
+
+
+def _build_automaton():
+    if ahocorasick is None:
+        return None
+    auto = ahocorasick.Automaton()
+    # Lower index = earlier in CATEGORY_RULES = higher priority.
+    for idx, (pattern, cat) in enumerate(_PATTERN_TO_CAT.items()):
+        auto.add_word(pattern, (idx, cat, pattern, None))
+    for pattern, note in _HEURISTIC_NOTES.items():
+        auto.add_word(pattern, (len(_PATTERN_TO_CAT), None, pattern, note))
+    auto.make_automaton()
+    return auto
+
+
+_AUTOMATON = _build_automaton()
+
+
 def extract_url_from_line(line: str) -> Optional[str]:
-    line = line.strip()
+    # Expects an already-stripped line; process_scripts strips and filters
+    # comments before calling, so no work is repeated here.
     if not line:
         return None
 
-    # If it's an HTML <script> tag, try to pull src="..."
-    if "<script" in line.lower():
-        m = SCRIPT_SRC_RE.search(line)
-        if m:
-            return m.group(1).strip()
-
-    # Otherwise, if it looks like a URL, just return it
+    # Common case first: the line is already a URL. A prefix test is cheap
+    # and avoids lowering the whole line just to look for "<script".
     if line.startswith(("http://", "https://", "//")):
         return line
 
+    # If it's an HTML <script> tag, try to pull src="..." — the regex is
+    # anchored on <script itself, so no separate lowercase gate is needed.
+    m = SCRIPT_SRC_RE.search(line)
+    if m:
+        return m.group(1).strip()
+
     # Bare hosts or paths without scheme are ignored for now
     return None
 
 
+@functools.lru_cache(maxsize=None)
 def normalize_url(url: str) -> Tuple[str, str, str]:
     # Handle protocol-relative URLs like //example.com/script.js
     if url.startswith("//"):
         url = "https:" + url
 
     parsed = urlparse(url)
-    scheme = parsed.scheme.lower()
-    host = (parsed.netloc or "").lower()
+    # Hosts and schemes repeat heavily across entries; interning makes the
+    # later dict tallies hit the identity fast path instead of re-hashing
+    # and comparing equal strings.
+    scheme = sys.intern(parsed.scheme.lower())
+    host = sys.intern((parsed.netloc or "").lower())
     path = parsed.path or "/"
     return scheme, host, path
 
 
+@functools.lru_cache(maxsize=None)
 def is_first_party(host: str, primary_domain: str) -> bool:
     if not host or not primary_domain:
         return False
@@ -152,59 +298,152 @@ def is_first_party(host: str, primary_domain: str) -> bool:
     return host == primary_domain or host.endswith("." + primary_domain)
 
 
-def classify_script(host: str, path: str) -> Tuple[str, str, List[str]]:
+@functools.lru_cache(maxsize=None)
+def classify_script(host: str, path_lower: str) -> Tuple[str, str, Tuple[str, ...]]:
     """
-    Return (category, subcategory, notes)
-    """
-    host = host.lower()
-    path = path.lower()
-    combined = host + path
+    Return (category, subcategory, notes).
 
-    for cat, patterns in CATEGORY_RULES.items():
-        for pattern in patterns:
-            if pattern.lower() in combined:
-                return cat, pattern, []
+    ``host`` and ``path_lower`` are already lowercased; callers normalize
+    once so no per-call lower() allocations happen here.
+    """
+    combined = host + path_lower
+
+    if _AUTOMATON is not None:
+        # One linear pass picks up category patterns and heuristic keywords.
+        # Selecting the minimum global pattern index reproduces the same
+        # CATEGORY_RULES rank priority as the per-category scan below.
+        best = None
+        matched_keywords = set()
+        for _, (idx, cat, pattern, note) in _AUTOMATON.iter(combined):
+            if cat is not None:
+                if best is None or idx < best[0]:
+                    best = (idx, cat, pattern)
+            else:
+                matched_keywords.add(pattern)
+        if best is not None:
+            return best[1], best[2], ()
+        # Emit notes in _HEURISTIC_NOTES order, like the fallback branch,
+        # rather than in string-position order.
+        notes: List[str] = []
+        for keyword, note in _HEURISTIC_NOTES.items():
+            if keyword in matched_keywords and note not in notes:
+                notes.append(note)
+        return "generic", "", tuple(notes)
+
+    # The trie resolves host-suffix hits cheaply, but a pattern from an
+    # earlier category can still outrank one, so a hit only caps how many
+    # categories the substring scan has to check before it is accepted.
+    hit = _host_suffix_lookup(host)
+    limit = _CAT_RANK[hit[0]] if hit is not None else len(_CAT_RES)
+    for rank in range(limit):
+        if _CAT_RES[rank].search(combined):
+            cat = _CATEGORY_LIST[rank]
+            return cat, _first_category_pattern(rank, combined), ()
+    if hit is not None:
+        return hit[0], _first_category_pattern(_CAT_RANK[hit[0]], combined), ()
 
     # Heuristics for generic but potentially risky cases
-    notes: List[str] = []
-    if "widget" in combined:
-        notes.append("Widget-style script (embedded component)")
-    if "tracker" in combined or "track" in combined:
-        notes.append("Tracking-related identifier in URL")
-    if "bundle" in combined or "vendor" in combined:
-        notes.append("Large JS bundle – may include multiple libraries")
+    notes = []
+    for keyword, note in _HEURISTIC_NOTES.items():
+        if keyword in combined and note not in notes:
+            notes.append(note)
 
     # Default category
-    return "generic", "", notes
+    return "generic", "", tuple(notes)
+
+
+# Inputs above this size fall back to line-by-line streaming.
+_BULK_READ_LIMIT = 64_000_000
+
+# Entry counts at or above this use the pandas bulk path when available;
+# below it, per-entry processing wins on setup cost.
+_BULK_CLASSIFY_MIN = 1000
 
 
 def read_input_lines(path: str) -> Iterable[str]:
-    with open(path, "r", encoding="utf-8") as f:
-        for line in f:
-            yield line.rstrip("\n")
+    # One read + splitlines beats per-line iteration for typical inputs;
+    # only genuinely huge files pay the streaming overhead.
+    if os.path.getsize(path) < _BULK_READ_LIMIT:
+        with open(path, "r", encoding="utf-8") as f:
+            return f.read().splitlines()
 
+    def _stream() -> Iterable[str]:
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                yield line.rstrip("\n")
 
-def process_scripts(
-    input_path: str,
-    primary_domain: str,
-) -> List[ScriptEntry]:
-    entries: List[ScriptEntry] = []
+    return _stream()
 
-    for line in read_input_lines(input_path):
+
+def _extract_candidates(lines: Iterable[str]) -> List[Tuple[str, str]]:
+    candidates: List[Tuple[str, str]] = []  # (raw line, extracted URL)
+    for line in lines:
         raw = line.strip()
-        if not raw or raw.startswith(("#", "//", "<!--")):
+        # Skip blanks and comments before any extraction work. A leading
+        # "//" is only a comment when it is not a protocol-relative URL
+        # like //cdn.example.com/app.js.
+        if not raw or raw.startswith(("#", "<!--")):
+            continue
+        if raw.startswith("//") and not raw[2:3].isalnum():
             continue
 
         url = extract_url_from_line(raw)
-        if not url:
-            continue
+        if url:
+            candidates.append((raw, url))
+    return candidates
+
+
+def _process_lines(lines: Iterable[str], primary_domain: str) -> List[ScriptEntry]:
+    """Worker for both the serial and multiprocess paths."""
+    primary = primary_domain.lower().lstrip(".")
+    primary_dot = "." + primary
+
+    candidates = _extract_candidates(lines)
+    if pandas is not None and len(candidates) >= _BULK_CLASSIFY_MIN:
+        return _process_candidates_bulk(candidates, primary, primary_dot)
+    return _process_candidates(candidates, primary, primary_dot)
 
+
+def process_scripts(
+    input_path: str,
+    primary_domain: str,
+    jobs: int = 1,
+) -> List[ScriptEntry]:
+    lines: Iterable[str] = read_input_lines(input_path)
+
+    if jobs > 1:
+        # Extraction and classification are CPU-bound and independent per
+        # line, so split the input into one chunk per worker and merge the
+        # results in order. Only this branch needs the full list; the
+        # serial path below keeps whatever iterator read_input_lines
+        # returned, so huge files can still stream.
+        lines = list(lines)
+        if lines:
+            chunk_size = -(-len(lines) // jobs)  # ceil division
+            chunks = [lines[i:i + chunk_size] for i in range(0, len(lines), chunk_size)]
+            with ProcessPoolExecutor(max_workers=jobs) as pool:
+                results = pool.map(_process_lines, chunks, [primary_domain] * len(chunks))
+            return [entry for part in results for entry in part]
+        # Empty input: nothing to chunk, fall through to the serial path.
+
+    return _process_lines(lines, primary_domain)
+
+
+def _process_candidates(
+    candidates: List[Tuple[str, str]],
+    primary: str,
+    primary_dot: str,
+) -> List[ScriptEntry]:
+    entries: List[ScriptEntry] = []
+
+    for raw, url in candidates:
         scheme, host, path = normalize_url(url)
-        category, subcategory, notes = classify_script(host, path)
-        fp = is_first_party(host, primary_domain)
+        # host is already lowercased by normalize_url.
+        category, subcategory, notes = classify_script(host, path.lower())
+        fp = bool(host and primary) and (host == primary or host.endswith(primary_dot))
 
         if not host:
-            notes.append("No host component detected")
+            notes = notes + ("No host component detected",)
 
         entry = ScriptEntry(
             raw=raw,
@@ -222,84 +461,147 @@ def process_scripts(
     return entries
 
 
-def generate_markdown_summary(
+def _process_candidates_bulk(
+    candidates: List[Tuple[str, str]],
+    primary: str,
+    primary_dot: str,
+) -> List[ScriptEntry]:
+    """Batch processing via pandas for large inventories.
+
+    Same results as _process_candidates by construction: classification
+    always goes through the cached classify_script, so a regex-only
+    column shortcut cannot drift from the trie/automaton semantics.
+    Only the first-party test is vectorized; duplicate URLs make the
+    per-row classify_script calls cheap cache hits.
+    """
+    normalized = [normalize_url(url) for _, url in candidates]
+    hosts = pandas.Series([n[1] for n in normalized], dtype="object")
+    if primary:
+        first_party = hosts.eq(primary) | hosts.str.endswith(primary_dot)
+    else:
+        first_party = pandas.Series(False, index=hosts.index)
+
+    entries: List[ScriptEntry] = []
+    for i, (raw, url) in enumerate(candidates):
+        scheme, host, path = normalized[i]
+        category, subcategory, notes = classify_script(host, path.lower())
+        if not host:
+            notes = notes + ("No host component detected",)
+
+        entries.append(
+            ScriptEntry(
+                raw=raw,
+                url=url,
+                scheme=scheme,
+                host=host,
+                path=path,
+                category=category,
+                subcategory=subcategory,
+                first_party=bool(host) and bool(first_party.iat[i]),
+                notes=notes,
+            )
+        )
+
+    return entries
+
+
+def write_markdown_summary(
     entries: List[ScriptEntry],
     primary_domain: str,
-) -> str:
+    out: TextIO,
+) -> None:
+    """Stream the summary report to ``out`` without building it in memory."""
     total = len(entries)
-    first_party = [e for e in entries if e.first_party]
-    third_party = [e for e in entries if not e.first_party]
-
-    cat_counts = Counter(e.category for e in entries)
-    domain_counts = Counter(e.host for e in entries if e.host)
-
-    lines: List[str] = []
-    lines.append(f"# Red Specter ScriptMap Summary")
-    lines.append("")
-    lines.append(f"**Primary domain:** `{primary_domain}`")
-    lines.append(f"**Total scripts detected:** {total}")
-    lines.append(f"- First-party: {len(first_party)}")
-    lines.append(f"- Third-party: {len(third_party)}")
-    lines.append("")
-
-    lines.append("## Category Breakdown")
-    lines.append("")
+
+    # One pass over entries feeds every tally the summary needs; plain
+    # dicts skip Counter's __missing__ machinery on every increment.
+    cat_counts: Dict[str, int] = defaultdict(int)
+    tp_domains: Dict[str, int] = defaultdict(int)  # third party only
+    fp_count = tp_count = 0
+    for e in entries:
+        cat_counts[e.category] += 1
+        if e.first_party:
+            fp_count += 1
+        else:
+            tp_count += 1
+            if e.host:
+                tp_domains[e.host] += 1
+
+    out.write(
+        f"# Red Specter ScriptMap Summary\n"
+        f"\n"
+        f"**Primary domain:** `{primary_domain}`\n"
+        f"**Total scripts detected:** {total}\n"
+        f"- First-party: {fp_count}\n"
+        f"- Third-party: {tp_count}\n"
+        f"\n"
+    )
+
+    out.write(_CATEGORY_HEADER)
     if not cat_counts:
-        lines.append("_No scripts detected._")
+        out.write("_No scripts detected._\n")
     else:
-        lines.append("| Category      | Count |")
-        lines.append("|--------------|-------|")
+        out.write("| Category      | Count |\n|--------------|-------|\n")
         for cat, count in sorted(cat_counts.items(), key=lambda x: (-x[1], x[0])):
-            lines.append(f"| {cat} | {count} |")
-    lines.append("")
-
-    lines.append("## Top Third-Party Domains")
-    lines.append("")
-    tp_domains = Counter(
-        e.host for e in third_party if e.host
-    )  # third party only
+            out.write(f"| {cat} | {count} |\n")
+    out.write("\n")
+
+    out.write(_TP_DOMAIN_HEADER)
     if not tp_domains:
-        lines.append("_No third-party script domains detected._")
+        out.write("_No third-party script domains detected._\n")
     else:
-        lines.append("| Domain | Count |")
-        lines.append("|--------|-------|")
-        for dom, count in sorted(tp_domains.items(), key=lambda x: (-x[1], x[0]))[:20]:
-            lines.append(f"| `{dom}` | {count} |")
-    lines.append("")
+        out.write("| Domain | Count |\n|--------|-------|\n")
+        # O(N log 20) selection instead of sorting every domain, on the
+        # same (-count, name) key the full sort used, so ties at the
+        # cutoff pick the same domains and the result is display-ordered.
+        top = heapq.nsmallest(20, tp_domains.items(), key=lambda kv: (-kv[1], kv[0]))
+        for dom, count in top:
+            out.write(f"| `{dom}` | {count} |\n")
+    out.write("\n")
 
-    lines.append("## Suggested Talking Points")
-    lines.append("")
-    lines.append("- Review all **third-party analytics and tracking scripts** for data minimisation and consent.")
-    lines.append("- Consider **Subresource Integrity (SRI)** for CDN-hosted libraries where feasible.")
-    lines.append("- Tighten your **Content-Security-Policy (CSP)** `script-src` to only allow the domains listed here.")
-    lines.append("- Audit embedded **payment, social, and widget scripts** for unnecessary permissions and data access.")
-    lines.append("- Maintain this script inventory as part of your **vendor and supply-chain security** documentation.")
-    lines.append("")
+    out.write(_SUMMARY_TAIL)
 
-    return "\n".join(lines)
 
+def generate_markdown_summary(
+    entries: List[ScriptEntry],
+    primary_domain: str,
+) -> str:
+    buf = io.StringIO()
+    write_markdown_summary(entries, primary_domain, buf)
+    return buf.getvalue()
 
-def generate_markdown_table(entries: List[ScriptEntry]) -> str:
-    lines: List[str] = []
-    lines.append("# Script Inventory")
-    lines.append("")
+
+def write_markdown_table(entries: List[ScriptEntry], out: TextIO) -> None:
+    """Stream the inventory table to ``out`` without building it in memory."""
+    out.write("# Script Inventory\n")
+    out.write("\n")
     if not entries:
-        lines.append("_No script URLs found in input._")
-        return "\n".join(lines)
+        out.write("_No script URLs found in input._\n")
+        return
 
-    lines.append("| URL | Host | Category | First/Third Party | Notes |")
-    lines.append("|-----|------|----------|-------------------|-------|")
+    out.write("| URL | Host | Category | First/Third Party | Notes |\n")
+    out.write("|-----|------|----------|-------------------|-------|\n")
 
+    # Collect plain tuples and emit them through one %-format join; for
+    # simple substitutions this beats building an f-string per row.
+    rows = []
     for e in entries:
-        party = "First-party" if e.first_party else "Third-party"
         notes = "; ".join(e.notes) if e.notes else ""
-        safe_url = e.url.replace("|", "\\|")
-        safe_host = (e.host or "").replace("|", "\\|")
-        safe_cat = e.category.replace("|", "\\|")
-        safe_notes = notes.replace("|", "\\|")
-        lines.append(f"| `{safe_url}` | `{safe_host}` | {safe_cat} | {party} | {safe_notes} |")
+        rows.append((
+            e.url.translate(_MD_ESCAPE),
+            (e.host or "").translate(_MD_ESCAPE),
+            e.category.translate(_MD_ESCAPE),
+            "First-party" if e.first_party else "Third-party",
+            notes.translate(_MD_ESCAPE),
+        ))
+    out.write("\n".join("| `%s` | `%s` | %s | %s | %s |" % row for row in rows))
+    out.write("\n")
 
-    return "\n".join(lines)
+
+def generate_markdown_table(entries: List[ScriptEntry]) -> str:
+    buf = io.StringIO()
+    write_markdown_table(entries, buf)
+    return buf.getvalue()
 
 
 def write_file(path: str, content: str) -> None:
@@ -333,6 +635,13 @@ def build_arg_parser() -> argparse.ArgumentParser:
         default="scriptmap",
         help="Prefix for output files (default: scriptmap).",
     )
+    p.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=1,
+        help="Worker processes for classification; useful for 50k+ line inputs (default: 1).",
+    )
     return p
 
 
@@ -340,15 +649,14 @@ def main() -> None:
     parser = build_arg_parser()
     args = parser.parse_args()
 
-    entries = process_scripts(args.input, args.primary_domain)
+    entries = process_scripts(args.input, args.primary_domain, jobs=args.jobs)
 
     base = args.output_prefix.rstrip(".md")
 
-    summary_md = generate_markdown_summary(entries, args.primary_domain)
-    inventory_md = generate_markdown_table(entries)
-
-    write_file(f"{base}_summary.md", summary_md)
-    write_file(f"{base}_inventory.md", inventory_md)
+    with open(f"{base}_summary.md", "w", encoding="utf-8", buffering=1 << 16) as f:
+        write_markdown_summary(entries, args.primary_domain, f)
+    with open(f"{base}_inventory.md", "w", encoding="utf-8", buffering=1 << 16) as f:
+        write_markdown_table(entries, f)
 
     print("[Red Specter] ScriptMap complete.")
     print(f"  Scripts detected: {len(entries)}")